@@ -5,15 +5,32 @@ with little modification.  The biggest incompatibility is string formatting.
 
 All dependencies are available in the standard distribution:
 
-  * copy
+  * functools
   * xml.etree.ElementTree
-  * xml.dom
 
 """
 
-import copy
+from functools import lru_cache
 import xml.etree.ElementTree as ET
-from xml.dom import minidom
+
+# an "svg" element's tag, either bare or (from a namespace-aware parse) qualified
+_SVG_TAGS = frozenset({"svg", "{http://www.w3.org/2000/svg}svg"})
+
+@lru_cache(maxsize=32)
+def _parse_viewbox(viewbox):
+    """Return the (min-x, min-y, width, height) of a `viewBox` attribute string, as floats."""
+    return tuple(float(i) for i in viewbox.replace(",", " ").split())
+
+def _ecopy(element):
+    """Return a deep copy of an element (and all its children).
+
+    The C-accelerated `Element` has its own `__deepcopy__`, which is called directly
+    (skipping the `copy` module's dispatch); otherwise the element is round-tripped
+    through the serializer.
+    """
+    if hasattr(element, "__deepcopy__"):
+        return element.__deepcopy__({})
+    return ET.fromstring(ET.tostring(element))
 
 # make this a class (derived from ET.Element) for introspection (TBR).
 # (e.g., examining the width/height/view-box/etc. after it's created)
@@ -31,6 +48,7 @@ class Canvas:
 
     Methods:
     add_graphic -- place an SVG sub-object onto the canvas.
+    pretty      -- the canvas as an indented SVG document string.
     write       -- save the canvas to a file, as SVG.
     """
 
@@ -65,22 +83,34 @@ class Canvas:
         self.width = px_scale*width
         self.height = px_scale*height
         # create the XML tree and root svg element:
-        self.svg = ET.Element("svg")
-        self.svg.set("xmlns", "http://www.w3.org/2000/svg")
-        self.svg.set("version", "1.1")
-        self.svg.set("width", f"{width}{units}")
-        self.svg.set("height", f"{height}{units}")
-        self.svg.set("viewBox", f"0 0 {self.width} {self.height}")
+        self.svg = ET.Element("svg", {"xmlns": "http://www.w3.org/2000/svg",
+                                      "version": "1.1",
+                                      "width": f"{width}{units}",
+                                      "height": f"{height}{units}",
+                                      "viewBox": f"0 0 {self.width} {self.height}"})
 
     def __repr__(self):
         return "Canvas(width=%r,height=%r,svg=%r)" % (self.width, self.height, self.svg)
 
     def __str__(self):
-        content = ET.tostring(self.svg, 'utf-8')
-        parsed = minidom.parseString(content)
-        return parsed.toprettyxml(indent="  ")
+        return ET.tostring(self.svg, encoding="unicode")
+
+    def pretty(self):
+        """Return the canvas, with all its content, as a pretty-printed SVG document.
+
+        Unlike `str()`, which is the bare (unformatted) `svg` element, this
+        indents the XML and includes the "xml" directive.  The canvas itself is
+        not changed.
+        """
+        return ET.tostring(self._indented(), encoding="unicode", xml_declaration=True)
+
+    def _indented(self):
+        """Return an indented copy of the canvas `svg` element, leaving the original alone."""
+        svg = _ecopy(self.svg)
+        ET.indent(svg, space="  ")
+        return svg
     
-    def add_graphic(self, svg, x=0, y=0, width=None, height=None):
+    def add_graphic(self, svg, x=0, y=0, width=None, height=None, copy=True):
         """Insert an SVG object onto the canvas, with position and size.
 
         Arguments:  
@@ -91,12 +121,18 @@ class Canvas:
         y      -- Offset from canvas top edge, in user coordinates (default 0)  
         width  -- Width of object, in user coordinates (default None)
         height -- Height of object, in user coordinates (default None)
+        copy   -- Whether to place a copy of `svg`, rather than `svg` itself (default True)
 
         This will create a copy of the `svg` argument (which must be an
         `svg` element, not some other SVG drawing object, like a group
-        (`g`) or rectangle (`rect`) etc.), and add it to the canvas at
+        (`g`) or rectangle (`rect`) etc.; a namespace-qualified `svg`,
+        e.g. from parsing an SVG file, is fine too), and add it to the canvas at
         the specified location and size.
 
+        If the `svg` is only going to be placed once, set `copy` to `False`
+        to skip the copy; the element itself is then positioned, sized, and
+        moved onto the canvas.
+
         If both `width` and `height` are provided, both will be used.
         If neither are provided (i.e., both are `None`), then the full
         extent of the canvas will be used -- but be aware of
@@ -105,24 +141,25 @@ class Canvas:
         from the `viewBox` of the object, such that the aspect ratio
         is maintained.  This prevents [mis]alignment artifacts.
         """
-        if svg.tag != 'svg':
+        if svg.tag not in _SVG_TAGS:
             raise ValueError("Non-SVG argument")
 
-        # we don't want to alter the original element, so make a copy
-        graphic = copy.deepcopy(svg)
-        graphic.set("x", str(x))
-        graphic.set("y", str(y))
-        if width is not None:
-            graphic.set("width", str(width))
-            if height is None:
-                viewbox = [int(i) for i in svg.attrib['viewBox'].split()]
-                graphic.set("height", str(width * viewbox[3] / viewbox[2]))
-        if height is not None:
-            graphic.set("height", str(height))
-            if width is None:
-                viewbox = [int(i) for i in svg.attrib['viewBox'].split()]
-                graphic.set("width", str(height * viewbox[2] / viewbox[3]))
-        # if both are None, don't set either; full canvas will be used.
+        # we don't want to alter the original element, so make a copy (unless told otherwise)
+        graphic = _ecopy(svg) if copy else svg
+        if width is not None and height is not None:
+            attrs = {"x": str(x), "y": str(y), "width": str(width), "height": str(height)}
+        elif width is not None:
+            viewbox = _parse_viewbox(svg.attrib['viewBox'])
+            attrs = {"x": str(x), "y": str(y), "width": str(width),
+                     "height": str(width * viewbox[3] / viewbox[2])}
+        elif height is not None:
+            viewbox = _parse_viewbox(svg.attrib['viewBox'])
+            attrs = {"x": str(x), "y": str(y), "height": str(height),
+                     "width": str(height * viewbox[2] / viewbox[3])}
+        else:
+            # if both are None, don't set either; full canvas will be used.
+            attrs = {"x": str(x), "y": str(y)}
+        graphic.attrib.update(attrs)
         self.svg.append(graphic)
     
     def write(self, filename, doctype=False):
@@ -135,28 +172,17 @@ class Canvas:
         Keyword Arguments:
         doctype -- whether to include a "DOCTYPE" declaration (default False)
 
-        By default, this just writes the straight XML, without a DOCTYPE declaration.
-        If you need a DOCTYPE, set `doctype` to `True`.  You'll get uglier output, however.
+        By default, this just writes the pretty-printed XML, without a DOCTYPE declaration.
+        If you need a DOCTYPE, set `doctype` to `True`.
         """
-        # we need the XML tree, no matter what:
-        content = ET.tostring(self.svg, 'utf-8')
+        tree = ET.ElementTree(self._indented())
         if doctype:
-            xmldecl = '<?xml version="1.0" standalone="no"?>'
-            doctype = '<!DOCTYPE svg PUBLIC "-//W3C//DTD SVG 1.1//EN" "http://www.w3.org/Graphics/SVG/1.1/DTD/svg11.dtd">'
-            with open(filename, 'w') as f:
+            xmldecl = b'<?xml version="1.0" encoding="utf-8" standalone="no"?>\n'
+            doctype = b'<!DOCTYPE svg PUBLIC "-//W3C//DTD SVG 1.1//EN" "http://www.w3.org/Graphics/SVG/1.1/DTD/svg11.dtd">\n'
+            with open(filename, 'wb') as f:
                 f.write(xmldecl)
                 f.write(doctype)
-                f.write(content)
+                tree.write(f, encoding="utf-8", xml_declaration=False)
         else:
-            # pretty-print it; this will include the "xml" directive (but no DOCTYPE)
-            parsed = minidom.parseString(content)
-            with open(filename, 'w') as f:
-                f.write(parsed.toprettyxml(indent="  "))
- 
-
-
-
-          
-
-    
-
+            # this will include the "xml" directive (but no DOCTYPE)
+            tree.write(filename, encoding="utf-8", xml_declaration=True, short_empty_elements=True)
@@ -1,14 +1,17 @@
 """Utility classes and functions for infographics and charts."""
 
-class Point:
+from itertools import cycle
+from typing import NamedTuple
+
+class Point(NamedTuple):
     """Convenience class to hold a cartesian point.
 
     It doesn't _do_ anything; just holds a cartesian coordinate pair 
-    in its `x` and `y` attributes.
+    in its `x` and `y` attributes.  Points are (named) tuples, so they
+    are immutable and hashable.
     """
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
+    x: float
+    y: float
 
 # TBD:
 # class Chart:
@@ -17,23 +20,20 @@ class Point:
 
 
 def progression(domain):
-    """Return a _generator_ to circularly step through a list of values.
+    """Return an _iterator_ to circularly step through a list of values.
     
     Arguments:
     domain -- list-like sequence of values to cycle through.
 
-    This returns a _generator_, not an object, where the first value
+    This returns an _iterator_ (an `itertools.cycle`), where the first value
     produced is the first value in `domain`, and subsequent values are
     sequential.  The sequence wraps at the end such that the value
     returned after the last is the first again.
 
-    Note that the generator is infinite; it will _never_ end.
+    Note that the iterator is infinite; it will _never_ end.
 
-    **Warning:** 
-    The `domain` argument is _global_.  Changing it _after_ creating 
-    the progression will affect the generated sequence and may have 
-    unpredictable results.  So be careful; it's probably safest to use 
-    anonymous expressions.  Or a tuple.
+    The `domain` is captured when the progression is created, so changing
+    it afterwards does not affect the generated sequence.
 
     >>> foo = infographics.chart.progression(['round', 'and'])
     >>> next(foo)
@@ -46,8 +46,4 @@ def progression(domain):
     'and'
 
     """
-    current = 0
-    while True:
-        yield domain[current]
-        current = (current + 1) % len(domain)
-    
+    return cycle(tuple(domain))
@@ -9,16 +9,18 @@ with little modification.  The biggest incompatibility is string formatting.
 
 All depenedencies are available in the standard distribution:
 
+  * functools
+  * itertools
   * math
-  * xml.dom
   * xml.etree.ElementTree
 
 """
 
 import xml.etree.ElementTree as ET
-from math import sin, cos, atan2, pi, degrees
+from functools import lru_cache
+from itertools import accumulate, cycle
+from math import sin, cos, atan2, pi, tau, degrees, fsum
 
-from .chart import Point, progression
 from .canvas import Canvas
 
 def normalize_angle(x):
@@ -40,6 +42,9 @@ class DonutStyle:
     In general, `DonutStyle` has reasonable defaults for charts with 5 - 10 wedges, 
     and labels/titles of one word (not too long).  Much of this can be tailored
     in the constructor.
+
+    A style is immutable once it has been constructed: setting (or deleting) any of
+    its attributes afterwards raises AttributeError.  Make a new style instead.
     """
 
     def __init__(self, **kwargs):
@@ -54,7 +59,7 @@ class DonutStyle:
         hole_color    -- fill for donut hole (default "silver")
         title_color   -- for title font (default "black")
         label_color   -- for label font (default "white")
-        wedge_colors  -- list-like for wedge fill color sequence
+        wedge_colors  -- list-like for wedge fill color sequence (must not be empty)
         start_angle   -- initial angle for first wedge, in radians. (0 is "East"; -pi/2 is "North")
 
         The "size" arguments are relative to the overall chart size.  So, for example, 
@@ -98,6 +103,9 @@ class DonutStyle:
             # perhaps we should warn about use of undefined settings?
 
         self.start_angle = normalize_angle(self.start_angle)
+        self.wedge_colors = tuple(self.wedge_colors)
+        if not self.wedge_colors:
+            raise ValueError("DonutStyle needs at least one wedge color")
         
         # librsvg (what GNOME and gThumb and others use to render SVG) is picky about the font class string.
         # It _doesn't_ like a composite "font" attribute (it wants it broken up into -family, -weight, etc.).
@@ -112,8 +120,36 @@ class DonutStyle:
         # Since virtually _everyone_ else does it right, this is pretty low on the priority list.
         
         self.fontspec = ".{cls} {{font-family:sans-serif;font-weight:bold;font-size:{size}px;dominant-baseline:middle;text-anchor:middle;stroke:none;fill:{color};}}"
+
+        # Everything that depends only on the style (not the dataset) is worked out once, here.
+        self._r = int(self.size/2)
+        self._r_hole = (self.hole_size * self.size)/2
+        self._r_text = (self._r + self._r_hole)/2 # halfway between hole and edge
+        self._r_s = str(self._r) # the center, in both x and y
+        self._r_hole_s = str(int(self._r_hole))
+        self._label_size = self.label_size * self.size
+        self._stroke_w = str(self.border_size * self.size)
+        self._viewbox = f"0 0 {self.size} {self.size}"
+        self._style_text = "\n".join((
+            self.fontspec.format(cls="title", size=self.title_size * self.size, color=self.title_color),
+            self.fontspec.format(cls="label", size=self._label_size, color=self.label_color)))
+        # everything the wedge layout depends on (and so its cache key; see `_cached_wedges`)
+        self._layout_key = (self.start_angle, self.wedge_colors, self._r, self._r_text, self._label_size)
+
+        # ... which is why the style can't change from here on.
+        self._frozen = True
         return
 
+    def __setattr__(self, name, value):
+        if getattr(self, "_frozen", False):
+            raise AttributeError(f"DonutStyle is immutable; can't set {name!r} (make a new style instead)")
+        super().__setattr__(name, value)
+
+    def __delattr__(self, name):
+        if getattr(self, "_frozen", False):
+            raise AttributeError(f"DonutStyle is immutable; can't delete {name!r}")
+        super().__delattr__(name)
+
     # __repr__
 
     # __str__
@@ -157,106 +193,127 @@ class DonutStyle:
 
         The easiest (well, safest) way to format wedge elements is the `mk_wedge` function.
         """
-        wedges = progression(self.wedge_colors)
-            
-        r = int(self.size/2)
-        center = Point(r, r)
-
-        total = sum([item[0] for item in dataset])
+        svg = ET.Element("svg", {"viewBox": self._viewbox})
 
-        r_hole = (self.hole_size * self.size)/2
-        r_text = (r + r_hole)/2 # halfway between hole and edge
+        chart = ET.SubElement(svg, "g", {"stroke": self.border_color,
+                                         "stroke-width": self._stroke_w})
 
-        svg = ET.Element("svg")
-        svg.set("viewBox", f"0 0 {self.size} {self.size}")
+        styles = ET.SubElement(chart, "style")
+        styles.text = self._style_text
 
-        chart = ET.Element("g")
-        chart.set("stroke", self.border_color)
-        chart.set("stroke-width", str(self.border_size * self.size))
-
-        styles = ET.Element("style")
-        title_size = (self.title_size * self.size)
-        label_size = (self.label_size * self.size)
-        font_title = self.fontspec.format(cls="title", size=title_size, color=self.title_color)
-        font_label = self.fontspec.format(cls="label", size=label_size, color=self.label_color)
-        styles.text = "\n".join((font_title, font_label))
-        chart.append(styles)
-        
-        # calculate the points from the origin; offset when generating shapes.
-        start_angle = self.start_angle
-        prior_angle = start_angle
-        start = Point(center.x + r*cos(start_angle), center.y + r*sin(start_angle))
-        cum_weight = 0 # avoid rounding errors by accumulating values, not angles.
-        
-        path_data = "M {c.x},{c.y} L {p1.x},{p1.y} A {r},{r} 0 {large},1 {p2.x},{p2.y} Z"
-
-        for weight, name, opts in dataset:
-            # Group wedge + label
-            item = ET.Element("g")
-            
-            cum_weight += weight
-            angle = start_angle + (cum_weight/total) * 2*pi
-            finish = Point(center.x + r*cos(angle), center.y + r*sin(angle))
-            if weight > total/2:
-                lg = 1
-            else:
-                lg = 0
-            wedge = ET.Element("path")
-            wedge.set("d", path_data.format(c=center, r=r, large=lg, p1=start, p2=finish))
-            wedge.set("fill", next(wedges))
-            item.append(wedge)
-
-            # The label goes in the center: halfway along the mid-angle between the hole and the edge.
-            bisect = (prior_angle + angle)/2
-            cx = center.x + (r_text * cos(bisect)) 
-            cy = center.y + (r_text * sin(bisect))
-            # ... but rotated along the center line by the opts
-            rotate = opts.get('rotate', False)
-            text_angle = degrees(normalize_angle(bisect)) if rotate else 0
-            # ... keep text right-side up; reflect angle at y-axis
-            flip_xy = 1
-            if not (-90 < text_angle < 90):
-                text_angle -= 180
-                flip_xy = -1
-            # ... and "nudged" a little by the opts
-            nudge_x = (opts.get("dx", 0) * label_size) * flip_xy
-            nudge_y = (opts.get("dy", 0) * label_size) * flip_xy
-            dx = nudge_x * cos(bisect) + nudge_y * cos(pi/2 + bisect)
-            dy = nudge_x * sin(bisect) + nudge_y * sin(pi/2 + bisect)
-            label = ET.Element("text")
-            label.set("x", "0")
-            label.set("y", "0")
-            label.set("class", "label")
-            label.set("transform", f"translate({str(cx+dx)} {str(cy+dy)}) rotate({text_angle})")
+        # Wedges and labels go straight into the chart (no per-wedge group);
+        # each wedge is followed by its label.
+        for path, fill, transform, name in self._wedges(dataset):
+            ET.SubElement(chart, "path", {"class": "wedge", "d": path, "fill": fill})
+            label = ET.SubElement(chart, "text", {"x": "0", "y": "0", "class": "label",
+                                                  "transform": transform})
             label.text = name
-            item.append(label)
-
-            chart.append(item)
-            start = finish
-            prior_angle = angle
             
         if self.hole_size > 0:
-            item = ET.Element("g")
-            
-            hole = ET.Element("circle")
-            hole.set("cx", str(center.x))
-            hole.set("cy", str(center.y))
-            hole.set("r", str(int((self.hole_size * self.size)/2)))
-            hole.set("fill", self.hole_color)
-            item.append(hole)
+            c = self._r_s
+            ET.SubElement(chart, "circle", {"class": "hole", "cx": c, "cy": c,
+                                            "r": self._r_hole_s,
+                                            "fill": self.hole_color})
 
             # there is no "nudge" for the title.  should there be?
-            label = ET.Element("text")
-            label.set("x", str(center.x))
-            label.set("y", str(center.y))
-            label.set("class", "title")
+            label = ET.SubElement(chart, "text", {"x": c, "y": c, "class": "title"})
             label.text = title
-            item.append(label)
-            chart.append(item)
 
-        svg.append(chart)
         return svg
 
+    def _wedges(self, dataset):
+        """Return the laid-out wedges of a chart for the `dataset`.
+
+        This is a tuple of (path data, fill, label transform, label) tuples, one
+        per wedge, in order.  It does all the geometry; `generate()` only has to
+        wrap the results in elements.
+
+        Layouts are cached (see `_cached_wedges`), so charting the same data in
+        the same style again skips the geometry entirely.
+        """
+        dataset = tuple(dataset) # it's walked more than once
+        try:
+            dataset_key = tuple((weight, name, tuple(sorted(opts.items()))) for weight, name, opts in dataset)
+            hash(dataset_key)
+        except TypeError:
+            # some label option (or mix of option keys) can't be keyed; just don't cache it.
+            return tuple(_lay_out(self._layout_key, dataset))
+        return _cached_wedges(self._layout_key, dataset_key)
+
+def _lay_out(layout_key, dataset):
+    """Lay out the wedges of a chart for the `dataset` (uncached).
+
+    The `layout_key` is a style's `_layout_key`: everything about the style
+    that the layout depends on.  This is a generator, yielding the tuples
+    for `DonutStyle._wedges()`.
+    """
+    start_angle, wedge_colors, r, r_text, label_size = layout_key
+    wedges = cycle(wedge_colors)
+
+    cx = cy = r # the center
+
+    if not dataset:
+        return
+    # unpack the wedges into parallel sequences, in one pass
+    weights, names, opts_list = zip(*dataset)
+    total = fsum(weights)
+    inv_total = 1.0/total
+    half_total = total/2
+
+    # calculate the points from the origin; offset when generating shapes.
+    # Every wedge boundary is computed up front, in one sweep, so each one
+    # only costs a single cos/sin pair.
+    angles = [start_angle]
+    # avoid rounding errors by accumulating values, not angles.
+    angles.extend(start_angle + (cum_weight*inv_total) * tau
+                  for cum_weight in accumulate(weights))
+    edges = [(cx + r*cos(angle), cy + r*sin(angle)) for angle in angles]
+
+    # the parts of the wedge path that are the same for every wedge
+    move = f"M {cx},{cy} L "
+    arc = f" A {r},{r} 0 "
+
+    for weight, name, opts, prior_angle, angle, (p1x, p1y), (p2x, p2y) in zip(weights, names, opts_list,
+                                                                             angles, angles[1:],
+                                                                             edges, edges[1:]):
+        if weight > half_total:
+            lg = 1
+        else:
+            lg = 0
+        path = f"{move}{p1x},{p1y}{arc}{lg},1 {p2x},{p2y} Z"
+
+        # The label goes in the center: halfway along the mid-angle between the hole and the edge.
+        bisect = (prior_angle + angle)/2
+        cos_b, sin_b = cos(bisect), sin(bisect)
+        tx = cx + (r_text * cos_b)
+        ty = cy + (r_text * sin_b)
+        # ... but rotated along the center line by the opts
+        rotate = opts.get('rotate', False)
+        text_angle = degrees(normalize_angle(bisect)) if rotate else 0
+        # ... keep text right-side up; reflect angle at y-axis
+        flip_xy = 1
+        if not (-90 < text_angle < 90):
+            text_angle -= 180
+            flip_xy = -1
+        # ... and "nudged" a little by the opts
+        nudge_x = (opts.get("dx", 0) * label_size) * flip_xy
+        nudge_y = (opts.get("dy", 0) * label_size) * flip_xy
+        # (cos(pi/2 + bisect) is -sin(bisect); sin(pi/2 + bisect) is cos(bisect))
+        dx = nudge_x * cos_b - nudge_y * sin_b
+        dy = nudge_x * sin_b + nudge_y * cos_b
+        transform = f"translate({tx+dx} {ty+dy}) rotate({text_angle})"
+
+        yield path, next(wedges), transform, name
+
+@lru_cache(maxsize=128)
+def _cached_wedges(layout_key, dataset_key):
+    """Memoized `_lay_out()`, by style layout key and (hashable) dataset.
+
+    The `dataset_key` is the dataset with each options dict flattened into a
+    sorted tuple of items.  Only plain values are kept, not the style itself.
+    """
+    return tuple(_lay_out(layout_key, [(weight, name, dict(opts)) for weight, name, opts in dataset_key]))
+
 def mk_wedge(weight, name="", dx=0, dy=0, rotate=False):
     """Construct a donut/pie chart dataset "wedge".
 
@@ -3,4 +3,5 @@ setup (
     name = "infographics",
     version = "0.0.1",
     install_requires = [],
+    python_requires = ">=3.9",
 )
@@ -0,0 +1,70 @@
+import os
+import tempfile
+import unittest
+import xml.etree.ElementTree as ET
+
+from infographics import canvas, donuts
+
+class CanvasCheck(unittest.TestCase):
+
+    def setUp(self):
+        self.page = canvas.Canvas(width=4, height=4)
+        self.chart = donuts.DonutStyle().generate([donuts.mk_wedge(1, "a"), donuts.mk_wedge(2, "b")])
+
+    def test_pretty_leaves_canvas_alone(self):
+        self.page.add_graphic(self.chart, copy=False)
+        bare = str(self.page)
+        pretty = self.page.pretty()
+        self.assertIn("\n  <svg", pretty)
+        self.assertEqual(bare, str(self.page))
+        self.assertIsNone(self.chart.text)
+
+    def test_add_graphic_copies(self):
+        self.page.add_graphic(self.chart, width=2)
+        self.assertIsNot(self.page.svg[0], self.chart)
+        self.assertNotIn("x", self.chart.attrib)
+
+    def test_add_graphic_no_copy(self):
+        self.page.add_graphic(self.chart, x=1, width=2, copy=False)
+        self.assertIs(self.page.svg[0], self.chart)
+        self.assertEqual(self.chart.get("x"), "1")
+        self.assertEqual(self.chart.get("height"), "2.0")
+
+    def test_namespaced_svg(self):
+        svg = ET.fromstring('<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 1 2"><rect /></svg>')
+        self.assertEqual(svg.tag, "{http://www.w3.org/2000/svg}svg")
+        self.page.add_graphic(svg, width=1)
+        self.assertEqual(self.page.svg[0].get("height"), "2.0")
+
+    def test_non_svg(self):
+        with self.assertRaises(ValueError):
+            self.page.add_graphic(ET.Element("g"))
+
+    def written(self, **kwargs):
+        """Write the canvas to a temporary file; return its text and parsed root."""
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, "canvas.svg")
+            self.page.write(filename, **kwargs)
+            with open(filename, encoding="utf-8") as f:
+                text = f.read()
+            root = ET.parse(filename).getroot()
+        return text, root
+
+    def test_write(self):
+        self.page.add_graphic(self.chart)
+        text, root = self.written()
+        self.assertTrue(text.startswith("<?xml version='1.0' encoding='utf-8'?>\n<svg"))
+        self.assertNotIn("<!DOCTYPE", text)
+        self.assertEqual(root.tag, "{http://www.w3.org/2000/svg}svg")
+        self.assertEqual(len(root), 1)
+
+    def test_write_doctype(self):
+        self.page.add_graphic(self.chart)
+        text, root = self.written(doctype=True)
+        lines = text.splitlines()
+        self.assertEqual(lines[0], '<?xml version="1.0" encoding="utf-8" standalone="no"?>')
+        self.assertEqual(lines[1], '<!DOCTYPE svg PUBLIC "-//W3C//DTD SVG 1.1//EN" '
+                                   '"http://www.w3.org/Graphics/SVG/1.1/DTD/svg11.dtd">')
+        self.assertTrue(lines[2].startswith("<svg "))
+        self.assertEqual(root.tag, "{http://www.w3.org/2000/svg}svg")
+        self.assertEqual(len(root), 1)
@@ -0,0 +1,50 @@
+import unittest
+
+from infographics import donuts
+
+class DonutStyleCheck(unittest.TestCase):
+
+    def test_immutable(self):
+        style = donuts.DonutStyle(title_color="red")
+        with self.assertRaises(AttributeError):
+            style.title_color = "blue"
+        with self.assertRaises(AttributeError):
+            del style.border_color
+        self.assertEqual(style.title_color, "red")
+
+    def test_wedge_colors_captured(self):
+        colors = ["red", "blue"]
+        style = donuts.DonutStyle(wedge_colors=colors)
+        colors[0] = "green"
+        self.assertEqual(style.wedge_colors, ("red", "blue"))
+
+    def test_no_wedge_colors(self):
+        with self.assertRaises(ValueError):
+            donuts.DonutStyle(wedge_colors=())
+
+class LayoutCacheCheck(unittest.TestCase):
+
+    data = [donuts.mk_wedge(3, "a"), donuts.mk_wedge(1, "b", rotate=True), donuts.mk_wedge(2, "c", dx=0.5)]
+
+    def uncached(self, style, dataset):
+        return tuple(donuts._lay_out(style._layout_key, dataset))
+
+    def test_not_stale(self):
+        north = donuts.DonutStyle()
+        north._wedges(self.data) # prime the cache
+        east = donuts.DonutStyle(start_angle=0.0, wedge_colors=("pink",))
+        self.assertEqual(east._wedges(self.data), self.uncached(east, self.data))
+        self.assertNotEqual(east._wedges(self.data), north._wedges(self.data))
+        self.assertEqual(north._wedges(self.data), self.uncached(north, self.data))
+
+    def test_iterator_dataset(self):
+        style = donuts.DonutStyle()
+        self.assertEqual(style._wedges(iter(self.data)), self.uncached(style, self.data))
+
+    def test_unhashable_options(self):
+        style = donuts.DonutStyle()
+        data = [(1, "a", {"dx": 0.1, "extra": []}), (2, "b", {})]
+        self.assertEqual(len(style._wedges(iter(data))), 2)
+        # option keys that can't be sorted together
+        data = [(1, "a", {1: 2, "dx": 0.1}), (2, "b", {})]
+        self.assertEqual(style._wedges(data), self.uncached(style, data))